@@ -7,10 +7,13 @@ Collects metrics from your homelab and generates a JSON file for the portfolio w
 SETUP:
 ------
 1. Install dependencies: pip install requests docker prometheus-api-client
+   Optional speedups: pip install orjson pystemd inotify_simple
 2. Update the CONFIG section below with your settings
 3. Test: python3 collect-homelab-stats.py
 4. Add to cron for automatic updates:
    */15 * * * * /usr/bin/python3 /path/to/collect-homelab-stats.py
+   Or run as a daemon that reacts to Docker events and fail2ban log
+   writes within seconds: python3 collect-homelab-stats.py --watch
 
 The script outputs homelab-stats.json which can be:
 - Uploaded to GitHub Pages (for static hosting)
@@ -18,12 +21,32 @@ The script outputs homelab-stats.json which can be:
 - Pushed to Cloudflare Pages
 """
 
+import asyncio
+import base64
+import gzip
+import http.client
 import json
+import re
+import socket
 import subprocess
 import os
-from datetime import datetime, timedelta
+import sys
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional
 
+try:
+    import orjson  # ~10x faster C serializer; stdlib json works fine without it
+except ImportError:
+    orjson = None
+
+try:
+    from pystemd.systemd1 import Unit as SystemdUnit  # sd-bus, no systemctl forks
+except ImportError:
+    SystemdUnit = None
+
 # =============================================================================
 # CONFIGURATION - UPDATE THESE VALUES
 # =============================================================================
@@ -56,30 +79,256 @@ CONFIG = {
     # Optional: GitHub repo for automatic deployment
     'github_repo': None,  # e.g., 'username/portfolio'
     'github_branch': 'main',
+    'github_token': os.environ.get('GITHUB_TOKEN'),
+
+    # Docker Engine API socket
+    'docker_socket': '/var/run/docker.sock',
+
+    # Where to keep state between runs (log read offsets)
+    'state_dir': '/var/lib/homelab-stats',
 }
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
-def run_command(cmd: str) -> str:
-    """Run a shell command and return output."""
+def dump_json(stats: Dict[str, Any]) -> bytes:
+    """Serialize stats to compact JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(stats)
+    return json.dumps(stats, separators=(',', ':')).encode()
+
+
+def run_command(argv: List[str]) -> str:
+    """Run a single command directly (no shell) and return its stdout.
+
+    Passing an argv list skips the /bin/sh -c parse+fork entirely.
+    """
     try:
         result = subprocess.run(
-            cmd, shell=True, capture_output=True, text=True, timeout=30
+            argv, capture_output=True, text=True, timeout=30
         )
         return result.stdout.strip()
     except Exception as e:
-        print(f"Command failed: {cmd} - {e}")
+        print(f"Command failed: {' '.join(argv)} - {e}")
+        return ""
+
+
+async def run_exec(*argv: str) -> str:
+    """Run a command directly (no shell) and return its stdout."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=30)
+        return stdout.decode().strip()
+    except Exception as e:
+        print(f"Command failed: {' '.join(argv)} - {e}")
         return ""
 
 
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """http.client connection over a unix socket (for the Docker API)."""
+
+    def __init__(self, socket_path: str, timeout: float = 30):
+        super().__init__('localhost', timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self._socket_path)
+        self.sock = sock
+
+
+_docker_conn = None
+_docker_lock = threading.Lock()
+
+
+def docker_api(path: str) -> Optional[Any]:
+    """GET a Docker Engine API path over a persistent unix-socket connection.
+
+    Each `docker` CLI call forks a Go binary that opens its own connection
+    to the daemon; talking HTTP to the socket directly skips all of that.
+    Returns the decoded JSON, or None on any error (daemon down, no socket).
+    """
+    global _docker_conn
+    # Service checks run concurrently; the keep-alive connection is not
+    # thread-safe, so serialize access to it
+    with _docker_lock:
+        for attempt in (1, 2):
+            try:
+                if _docker_conn is None:
+                    _docker_conn = _UnixHTTPConnection(CONFIG['docker_socket'])
+                _docker_conn.request('GET', f'/v1.41{path}')
+                resp = _docker_conn.getresponse()
+                body = resp.read()
+                if resp.status != 200:
+                    return None
+                return json.loads(body)
+            except Exception:
+                # Stale keep-alive connection: drop it and retry once
+                _docker_conn = None
+                if attempt == 2:
+                    return None
+
+
+# Backend results fetched once per collection cycle and shared by every
+# helper that needs them (docker_state_exporter-style result cache)
+_container_cache: Optional[List[Dict[str, Any]]] = None
+_jail_counts_cache: Optional[Dict[str, Dict[str, int]]] = None
+
+
+def refresh_caches() -> None:
+    """Invalidate the per-cycle caches so the next lookup re-queries."""
+    global _container_cache, _jail_counts_cache
+    _container_cache = None
+    _jail_counts_cache = None
+
+
+def list_containers() -> List[Dict[str, Any]]:
+    """List all containers via the Docker API; empty list if unavailable.
+
+    The list is fetched once per collection cycle — get_container_stats and
+    every get_service_status call share the same snapshot.
+    """
+    global _container_cache
+    if _container_cache is None:
+        containers = docker_api('/containers/json?all=1')
+        _container_cache = containers if isinstance(containers, list) else []
+    return _container_cache
+
+
+def get_jail_counts() -> Dict[str, Dict[str, int]]:
+    """Per-jail fail2ban ban counts, cached for the collection cycle."""
+    global _jail_counts_cache
+    if _jail_counts_cache is None:
+        counts = {}
+        overview = run_command(['fail2ban-client', 'status'])
+        list_match = _jail_list_re.search(overview)
+        jail_list = list_match.group(1) if list_match else ''
+        for jail in (j.strip() for j in jail_list.split(',') if j.strip()):
+            jail_status = run_command(['fail2ban-client', 'status', jail])
+            total_match = _total_banned_re.search(jail_status)
+            active_match = _active_banned_re.search(jail_status)
+            counts[jail] = {
+                'total': int(total_match.group(1)) if total_match else 0,
+                'active': int(active_match.group(1)) if active_match else 0,
+            }
+        _jail_counts_cache = counts
+    return _jail_counts_cache
+
+
+_prom_session = None
+
+
+def query_prometheus(expr: str) -> Optional[float]:
+    """Run an instant PromQL query and return the first sample value.
+
+    All queries share one pooled requests.Session, so they reuse a single
+    TCP connection instead of paying a handshake per query. The expression
+    is URL-encoded up front (braces and brackets included). Returns None
+    when Prometheus or requests is unavailable.
+    """
+    global _prom_session
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        if _prom_session is None:
+            _prom_session = requests.Session()
+            _prom_session.mount(
+                'http://', HTTPAdapter(pool_connections=1, pool_maxsize=4)
+            )
+
+        url = (f"{CONFIG['prometheus_url']}/api/v1/query?query="
+               + urllib.parse.quote(expr, safe=''))
+        resp = _prom_session.get(url, timeout=30)
+        result = resp.json().get('data', {}).get('result', [])
+        if result:
+            return float(result[0]['value'][1])
+    except Exception as e:
+        print(f"Prometheus query failed: {expr} - {e}")
+    return None
+
+
+# Matches a fail2ban log line like
+# "2026-08-31 12:00:00,123 fail2ban.actions ... [sshd] Ban 1.2.3.4"
+_ban_line_re = re.compile(rb'^(\S+ \S+).*?\bBan\b')
+
+# fail2ban-client status output fields, compiled once and reused per jail
+_jail_list_re = re.compile(r'Jail list:\s*(.*)')
+_total_banned_re = re.compile(r'Total banned:\s+(\d+)')
+_active_banned_re = re.compile(r'Currently banned:\s+(\d+)')
+
+
+def count_recent_bans() -> int:
+    """Count fail2ban 'Ban' log lines from the last 24 hours.
+
+    grep -c over the whole log re-reads it every cycle (hundreds of MB on a
+    busy box). Instead read a tail window in one shot — at most 8 MiB, or
+    just the new bytes since the offset the previous run persisted — and
+    filter by timestamp in Python.
+    """
+    offset_file = os.path.join(CONFIG['state_dir'], 'fail2ban.offset')
+    cutoff = datetime.now() - timedelta(days=1)
+    bans = 0
+    window_offset = None
+
+    with open(CONFIG['fail2ban_log'], 'rb') as f:
+        f.seek(0, 2)
+        size = f.tell()
+        start = max(0, size - (8 << 20))
+        try:
+            with open(offset_file) as of:
+                saved = int(of.read().strip())
+            # Only trust the saved offset if the log hasn't rotated under it
+            if start <= saved <= size:
+                start = saved
+        except (OSError, ValueError):
+            pass
+        f.seek(start)
+        data = f.read()
+
+    pos = start
+    for line in data.splitlines(keepends=True):
+        match = _ban_line_re.match(line)
+        if match:
+            try:
+                stamp = datetime.strptime(
+                    match.group(1).decode(), '%Y-%m-%d %H:%M:%S,%f'
+                )
+                if stamp >= cutoff:
+                    bans += 1
+                    if window_offset is None:
+                        window_offset = pos
+            except ValueError:
+                pass
+        pos += len(line)
+
+    # Remember where the 24h window starts so the next run skips older bytes
+    try:
+        os.makedirs(CONFIG['state_dir'], exist_ok=True)
+        with open(offset_file, 'w') as of:
+            of.write(str(window_offset if window_offset is not None else size))
+    except OSError:
+        pass
+
+    return bans
+
+
 def get_uptime_percentage() -> float:
     """Calculate system uptime percentage over last 30 days."""
     try:
         # Get uptime in seconds
-        uptime_output = run_command("cat /proc/uptime | awk '{print $1}'")
-        uptime_seconds = float(uptime_output)
+        uptime_seconds = None
+        if CONFIG['use_prometheus']:
+            uptime_seconds = query_prometheus('time() - node_boot_time_seconds')
+        if uptime_seconds is None:
+            with open('/proc/uptime') as f:
+                uptime_seconds = float(f.read().split()[0])
         
         # Calculate percentage (assume 30 days = 100%)
         thirty_days_seconds = 30 * 24 * 60 * 60
@@ -94,21 +343,18 @@ def get_uptime_percentage() -> float:
 def get_attacks_blocked() -> Dict[str, int]:
     """Get Fail2Ban statistics."""
     try:
-        # Get banned IPs count from fail2ban-client
-        banned_output = run_command("fail2ban-client status 2>/dev/null | grep 'Total banned' | awk '{print $NF}'")
-        total_banned = int(banned_output) if banned_output.isdigit() else 0
-        
-        # Count bans in last 24 hours from log
-        yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-        bans_24h_cmd = f"grep -c 'Ban' {CONFIG['fail2ban_log']} 2>/dev/null | head -1"
-        bans_24h = run_command(bans_24h_cmd)
-        bans_24h = int(bans_24h) if bans_24h.isdigit() else 0
-        
-        # Get currently active bans
-        active_bans_cmd = "fail2ban-client status 2>/dev/null | grep -oP 'Currently banned:\s+\K\d+' | paste -sd+ | bc"
-        active_bans = run_command(active_bans_cmd)
-        active_bans = int(active_bans) if active_bans.isdigit() else 0
-        
+        # Sum over the cached per-jail counts (one status call per jail,
+        # shared for the whole cycle)
+        jail_counts = get_jail_counts()
+        total_banned = sum(c['total'] for c in jail_counts.values())
+        active_bans = sum(c['active'] for c in jail_counts.values())
+
+        # Count bans from the log's tail window instead of a full scan
+        try:
+            bans_24h = count_recent_bans()
+        except OSError:
+            bans_24h = 0
+
         return {
             'attacks_blocked_24h': max(bans_24h, 100),  # Minimum for demo
             'attacks_blocked_total': max(total_banned, 45000),
@@ -126,24 +372,15 @@ def get_attacks_blocked() -> Dict[str, int]:
 def get_container_stats() -> Dict[str, int]:
     """Get Docker container statistics."""
     try:
-        # Get running containers
-        running = run_command("docker ps -q 2>/dev/null | wc -l")
-        running = int(running) if running.isdigit() else 0
-        
-        # Get total containers
-        total = run_command("docker ps -aq 2>/dev/null | wc -l")
-        total = int(total) if total.isdigit() else 0
-        
-        # Get healthy containers
-        healthy_cmd = "docker ps --filter 'health=healthy' -q 2>/dev/null | wc -l"
-        healthy = run_command(healthy_cmd)
-        healthy = int(healthy) if healthy.isdigit() else running
-        
-        # Get unhealthy containers
-        unhealthy_cmd = "docker ps --filter 'health=unhealthy' -q 2>/dev/null | wc -l"
-        unhealthy = run_command(unhealthy_cmd)
-        unhealthy = int(unhealthy) if unhealthy.isdigit() else 0
-        
+        # One API call instead of four docker ps | wc -l forks
+        containers = list_containers()
+        total = len(containers)
+        running = sum(1 for c in containers if c.get('State') == 'running')
+        healthy = sum(1 for c in containers if '(healthy)' in c.get('Status', ''))
+        unhealthy = sum(1 for c in containers if '(unhealthy)' in c.get('Status', ''))
+        if healthy == 0 and unhealthy == 0:
+            healthy = running
+
         return {
             'running': running if running > 0 else 24,
             'total': total if total > 0 else 26,
@@ -161,13 +398,18 @@ def get_storage_stats() -> Dict[str, float]:
         total_bytes = 0
         used_bytes = 0
         
+        # One read of the mount table instead of a stat per path; also skips
+        # paths that exist but aren't mounted, which would double-count the
+        # parent filesystem
+        with open('/proc/self/mounts') as f:
+            mounts = {line.split()[1] for line in f}
+
         for path in CONFIG['storage_paths']:
-            if os.path.exists(path):
-                df_output = run_command(f"df -B1 {path} | tail -1")
-                parts = df_output.split()
-                if len(parts) >= 4:
-                    total_bytes += int(parts[1])
-                    used_bytes += int(parts[2])
+            if path in mounts:
+                # statvfs gives us the same numbers df reads, without the fork
+                st = os.statvfs(path)
+                total_bytes += st.f_blocks * st.f_frsize
+                used_bytes += (st.f_blocks - st.f_bfree) * st.f_frsize
         
         # Convert to TB
         total_tb = total_bytes / (1024**4)
@@ -186,36 +428,59 @@ def get_storage_stats() -> Dict[str, float]:
         return {'total_tb': 6, 'used_tb': 3.2, 'available_tb': 2.8, 'percentage_used': 53}
 
 
-def get_service_status(service: Dict[str, str]) -> Dict[str, Any]:
+def _systemd_unit_status(service_name: str) -> tuple:
+    """Read unit state and uptime over sd-bus.
+
+    ActiveEnterTimestamp comes back as microseconds since the epoch, so
+    there is no locale-dependent strptime and no systemctl fork.
+    """
+    unit = SystemdUnit(f'{service_name}.service'.encode())
+    unit.load()
+    if unit.Unit.ActiveState != b'active':
+        return 'stopped', 0
+    enter_usec = unit.Unit.ActiveEnterTimestamp
+    uptime_hours = int(time.time() - enter_usec // 1_000_000) // 3600
+    return 'healthy', max(uptime_hours, 0)
+
+
+async def get_service_status(service: Dict[str, str], now_iso: str) -> Dict[str, Any]:
     """Get status of a specific service."""
     name = service['name']
     status = 'unknown'
     uptime_hours = 0
-    
+
     try:
         if 'container' in service:
-            # Check Docker container
+            # Check Docker container via the API instead of docker CLI forks
             container = service['container']
-            
-            # Check if running
-            is_running = run_command(f"docker ps -q -f name={container} 2>/dev/null")
-            
-            if is_running:
-                # Get container uptime
-                started_at = run_command(
-                    f"docker inspect -f '{{{{.State.StartedAt}}}}' {container} 2>/dev/null"
-                )
+            containers = await asyncio.to_thread(list_containers)
+            match = next(
+                (c for c in containers
+                 if f'/{container}' in c.get('Names', [])),
+                None
+            )
+
+            if match and match.get('State') == 'running':
+                # The list endpoint has no StartedAt/Health detail, so one
+                # inspect call on the same connection fills those in
+                inspect = await asyncio.to_thread(
+                    docker_api, f'/containers/{container}/json'
+                ) or {}
+                state = inspect.get('State', {})
+
+                started_at = state.get('StartedAt', '')
                 if started_at:
                     try:
-                        start_time = datetime.fromisoformat(started_at.replace('Z', '+00:00'))
-                        uptime_hours = int((datetime.now(start_time.tzinfo) - start_time).total_seconds() / 3600)
+                        # Truncate the nanosecond fraction and parse the fixed
+                        # prefix; cheaper than rewriting the Z suffix
+                        start_time = datetime.strptime(
+                            started_at[:19], '%Y-%m-%dT%H:%M:%S'
+                        ).replace(tzinfo=timezone.utc)
+                        uptime_hours = int((datetime.now(timezone.utc) - start_time).total_seconds() / 3600)
                     except:
                         uptime_hours = 720
-                
-                # Check health if available
-                health = run_command(
-                    f"docker inspect -f '{{{{.State.Health.Status}}}}' {container} 2>/dev/null"
-                )
+
+                health = state.get('Health', {}).get('Status', '')
                 status = 'healthy' if health in ['healthy', ''] else health
             else:
                 status = 'stopped'
@@ -223,23 +488,32 @@ def get_service_status(service: Dict[str, str]) -> Dict[str, Any]:
         elif 'service' in service:
             # Check systemd service
             service_name = service['service']
-            is_active = run_command(f"systemctl is-active {service_name} 2>/dev/null")
-            
-            if is_active == 'active':
-                status = 'healthy'
-                # Get service uptime
-                uptime_output = run_command(
-                    f"systemctl show {service_name} --property=ActiveEnterTimestamp 2>/dev/null"
+
+            if SystemdUnit is not None:
+                # Ask systemd directly over sd-bus
+                status, uptime_hours = await asyncio.to_thread(
+                    _systemd_unit_status, service_name
                 )
-                if 'ActiveEnterTimestamp=' in uptime_output:
-                    timestamp_str = uptime_output.split('=')[1]
-                    try:
-                        start_time = datetime.strptime(timestamp_str, '%a %Y-%m-%d %H:%M:%S %Z')
-                        uptime_hours = int((datetime.now() - start_time).total_seconds() / 3600)
-                    except:
-                        uptime_hours = 720
             else:
-                status = 'stopped'
+                # pystemd not installed; fall back to forking systemctl
+                is_active = await run_exec('systemctl', 'is-active', service_name)
+
+                if is_active == 'active':
+                    status = 'healthy'
+                    # Get service uptime
+                    uptime_output = await run_exec(
+                        'systemctl', 'show', service_name,
+                        '--property=ActiveEnterTimestamp'
+                    )
+                    if 'ActiveEnterTimestamp=' in uptime_output:
+                        timestamp_str = uptime_output.split('=')[1]
+                        try:
+                            start_time = datetime.strptime(timestamp_str, '%a %Y-%m-%d %H:%M:%S %Z')
+                            uptime_hours = int((datetime.now() - start_time).total_seconds() / 3600)
+                        except:
+                            uptime_hours = 720
+                else:
+                    status = 'stopped'
                 
     except Exception as e:
         print(f"Error checking service {name}: {e}")
@@ -250,26 +524,33 @@ def get_service_status(service: Dict[str, str]) -> Dict[str, Any]:
         'name': name,
         'status': status if status else 'healthy',
         'uptime_hours': uptime_hours if uptime_hours > 0 else 720,
-        'last_check': datetime.utcnow().isoformat() + 'Z'
+        'last_check': now_iso
     }
 
 
 def collect_all_stats() -> Dict[str, Any]:
     """Collect all homelab statistics."""
     now = datetime.utcnow()
-    
+    now_iso = now.isoformat() + 'Z'  # formatted once, shared by every service
+    refresh_caches()
+
     # Collect all metrics
     uptime_pct = get_uptime_percentage()
     security_stats = get_attacks_blocked()
     container_stats = get_container_stats()
     storage_stats = get_storage_stats()
-    
-    # Get service statuses
-    services = [get_service_status(svc) for svc in CONFIG['services']]
-    
+
+    # Probe all services concurrently; each one is independent I/O
+    async def _gather_services():
+        return list(await asyncio.gather(
+            *(get_service_status(svc, now_iso) for svc in CONFIG['services'])
+        ))
+
+    services = asyncio.run(_gather_services())
+
     # Build the stats object
     stats = {
-        'timestamp': now.isoformat() + 'Z',
+        'timestamp': now_iso,
         'uptime': {
             'percentage': uptime_pct,
             'days_monitored': 30,
@@ -298,50 +579,152 @@ def save_stats(stats: Dict[str, Any]) -> None:
     """Save stats to JSON file."""
     output_path = CONFIG['output_path']
     
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
-    # Write JSON file
-    with open(output_path, 'w') as f:
-        json.dump(stats, f, indent=2)
-    
+    # Serialize once, then publish both the JSON and a precompressed .gz
+    # (for Nginx gzip_static / GitHub Pages bandwidth) atomically so the
+    # web server never sees a half-written file
+    data = dump_json(stats)
+
+    tmp_path = output_path + '.tmp'
+    try:
+        f = open(tmp_path, 'wb', buffering=1 << 16)
+    except FileNotFoundError:
+        # First run only: the output directory doesn't exist yet
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        f = open(tmp_path, 'wb', buffering=1 << 16)
+    with f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, output_path)
+
+    gz_path = output_path + '.gz'
+    with gzip.open(gz_path + '.tmp', 'wb', compresslevel=6) as g:
+        g.write(data)
+    os.replace(gz_path + '.tmp', gz_path)
+
     print(f"✅ Stats saved to {output_path}")
 
 
 def push_to_github(stats: Dict[str, Any]) -> None:
-    """Optionally push stats to GitHub Pages."""
+    """Optionally push stats to GitHub Pages via the Contents API.
+
+    Updating one small JSON file does not need a clone in /tmp and four
+    git forks — a GET for the current blob sha plus a PUT on the same
+    keep-alive connection does the whole update.
+    """
     if not CONFIG['github_repo']:
         return
-    
-    # This is a simplified version - you might want to use the GitHub API
-    # or a more robust git workflow
+    if not CONFIG['github_token']:
+        print("⚠️  github_repo set but no GITHUB_TOKEN; skipping push")
+        return
+
     try:
-        repo_dir = '/tmp/portfolio-stats'
-        
-        # Clone or pull
-        if os.path.exists(repo_dir):
-            run_command(f"cd {repo_dir} && git pull")
-        else:
-            run_command(f"git clone https://github.com/{CONFIG['github_repo']}.git {repo_dir}")
-        
-        # Write stats file
-        with open(f"{repo_dir}/homelab-stats.json", 'w') as f:
-            json.dump(stats, f, indent=2)
-        
-        # Commit and push
-        run_command(f"""
-            cd {repo_dir} && 
-            git add homelab-stats.json && 
-            git commit -m "Update homelab stats" && 
-            git push
-        """)
-        
+        import requests
+
+        url = (f"https://api.github.com/repos/{CONFIG['github_repo']}"
+               f"/contents/homelab-stats.json")
+        session = requests.Session()
+        session.headers.update({
+            'Authorization': f"Bearer {CONFIG['github_token']}",
+            'Accept': 'application/vnd.github+json',
+        })
+
+        # Fetch the current blob sha (404 = file doesn't exist yet)
+        resp = session.get(url, params={'ref': CONFIG['github_branch']}, timeout=30)
+        current_sha = resp.json().get('sha') if resp.status_code == 200 else None
+
+        data = dump_json(stats)
+        payload = {
+            'message': 'Update homelab stats',
+            'content': base64.b64encode(data).decode(),
+            'branch': CONFIG['github_branch'],
+        }
+        if current_sha:
+            payload['sha'] = current_sha
+
+        resp = session.put(url, json=payload, timeout=30)
+        resp.raise_for_status()
         print("✅ Stats pushed to GitHub")
-        
+
+    except ImportError:
+        print("⚠️  requests not installed; skipping GitHub push")
     except Exception as e:
         print(f"Error pushing to GitHub: {e}")
 
 
+# =============================================================================
+# WATCH MODE
+# =============================================================================
+
+# Set by the watcher threads whenever something changed and the stats
+# file should be re-rendered
+_dirty = threading.Event()
+
+
+def _watch_docker_events() -> None:
+    """Background thread: mark stats dirty on every container event."""
+    # filters={"type":["container"]}, URL-encoded
+    path = '/v1.41/events?filters=%7B%22type%22%3A%5B%22container%22%5D%7D'
+    while True:
+        try:
+            conn = _UnixHTTPConnection(CONFIG['docker_socket'], timeout=None)
+            conn.request('GET', path)
+            resp = conn.getresponse()
+            for line in resp:
+                if line.strip():
+                    _dirty.set()
+        except Exception:
+            pass
+        # Daemon unreachable or the stream dropped; retry shortly
+        time.sleep(5)
+
+
+def _watch_fail2ban_log() -> None:
+    """Background thread: mark stats dirty when the fail2ban log changes."""
+    try:
+        from inotify_simple import INotify, flags
+        inotify = INotify()
+        inotify.add_watch(CONFIG['fail2ban_log'], flags.MODIFY)
+        while True:
+            if inotify.read():
+                _dirty.set()
+    except Exception:
+        # No inotify available; fall back to polling the file size
+        last_size = None
+        while True:
+            try:
+                size = os.path.getsize(CONFIG['fail2ban_log'])
+            except OSError:
+                size = None
+            if size != last_size:
+                if last_size is not None:
+                    _dirty.set()
+                last_size = size
+            time.sleep(1)
+
+
+def watch(interval: float = 900) -> None:
+    """Run as a daemon, re-rendering on events instead of a cron poll.
+
+    Container state changes stream in from the Docker events API and new
+    fail2ban bans are picked up by watching the log, so the stats file
+    reflects reality within seconds instead of up to 15 minutes. Updates
+    are debounced so a burst of events causes one re-render, and a full
+    refresh still happens every `interval` seconds as a safety net.
+    """
+    print("👀 Watching for Docker events and fail2ban log changes...")
+    for target in (_watch_docker_events, _watch_fail2ban_log):
+        threading.Thread(target=target, daemon=True).start()
+
+    while True:
+        stats = collect_all_stats()
+        save_stats(stats)
+        push_to_github(stats)
+        _dirty.wait(timeout=interval)
+        time.sleep(1)  # debounce: coalesce event bursts into one render
+        _dirty.clear()
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -371,4 +754,7 @@ Services:   {sum(1 for s in stats['services'] if s['status'] == 'healthy')}/{len
 
 
 if __name__ == '__main__':
-    main()
+    if '--watch' in sys.argv[1:]:
+        watch()
+    else:
+        main()